@@ -13,7 +13,7 @@ from app.services.monitoring.metrics_collector import AdjustmentDecision, metric
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentMetrics:
     latency_ms: float = 0.0
     retries: int = 0
@@ -117,6 +117,7 @@ async def stream_orchestrator_state(
     async def event_stream() -> AsyncIterator[str]:
         last_payload: Optional[dict] = None
         last_agent_states: Dict[str, dict] = {}
+        last_marker: Optional[tuple] = None
         try:
             while True:
                 job = orchestrator.get_job(job_id)
@@ -124,6 +125,15 @@ async def stream_orchestrator_state(
                     yield 'event: error\ndata: {"detail": "Análise não encontrada"}\n\n'
                     return
 
+                # Agent progress writes keep ``updated_at`` unchanged on the SQL
+                # path, so pair it with the (small) agent states; when neither
+                # moved, skip re-serialising and diffing the full result payload.
+                marker = (job.updated_at, job.status, job.agent_states)
+                if marker == last_marker:
+                    await asyncio.sleep(1)
+                    continue
+                last_marker = (job.updated_at, job.status, deepcopy(job.agent_states))
+
                 payload = _serialize_job(job)
                 agent_states = payload.get("agentStates") if isinstance(payload, dict) else {}
                 if isinstance(agent_states, dict):
@@ -1,9 +1,19 @@
 from __future__ import annotations
 
+import importlib.util
+import json
+
 from fastapi import APIRouter, HTTPException, Response
 
 from app.storage.session_store import aggregate_bundles, load_bundle, save_bundle
 
+_ORJSON_AVAILABLE = importlib.util.find_spec("orjson") is not None
+
+if _ORJSON_AVAILABLE:  # pragma: no cover - exercised in full environments
+    import orjson
+else:  # pragma: no cover - lightweight environments
+    orjson = None  # type: ignore[assignment]
+
 router = APIRouter(prefix="/export", tags=["export"])
 
 
@@ -31,7 +41,7 @@ async def export_full() -> Response:
     )
 
 
-def json_dumps(data: dict) -> str:
-    import json
-
-    return json.dumps(data, ensure_ascii=False, indent=2)
+def json_dumps(data: dict) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
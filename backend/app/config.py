@@ -93,6 +93,7 @@ class Settings(BaseSettings):
     # LLM configuration
     llm_model: str = Field("gemini-2.0-flash", env="LLM_MODEL")
     llm_endpoint: Optional[str] = Field(None, env="LLM_ENDPOINT")
+    chat_history_turns: int = Field(100, env="CHAT_HISTORY_TURNS")
 
     # Token budgeting
     token_budget_total: int = Field(120_000, env="TOKEN_BUDGET_TOTAL")
@@ -121,6 +122,7 @@ class Settings(BaseSettings):
 
     # OCR configuration
     ocr_language: str = Field("por", env="OCR_LANGUAGE")
+    ocr_max_concurrency: int = Field(3, env="OCR_MAX_CONCURRENCY")
 
     # Secure bucket (S3/MinIO)
     bucket_endpoint_url: Optional[str] = Field(None, env="BUCKET_ENDPOINT_URL")
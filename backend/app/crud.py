@@ -24,6 +24,41 @@ from .models import (
     OperationType,
 )
 
+
+def _merge_agent_state(
+    agent_states: Dict[str, Dict[str, object]],
+    agent: str,
+    status: AgentStatus,
+    *,
+    step: Optional[str],
+    current: Optional[int],
+    total: Optional[int],
+    extra: Optional[Dict[str, object]],
+) -> Optional[Dict[str, Dict[str, object]]]:
+    """Return a copy of ``agent_states`` with ``agent`` patched, or ``None`` if unchanged.
+
+    Only the outer mapping and the touched agent's entry are copied; the other
+    agents' states are shared, since updates always replace rather than mutate them.
+    """
+    previous = agent_states.get(agent) or {"status": AgentStatus.PENDING.value, "progress": {}}
+    progress = dict(previous.get("progress") or {})
+    if step is not None:
+        progress["step"] = step
+    if current is not None:
+        progress["current"] = current
+    if total is not None:
+        progress["total"] = total
+    if extra:
+        progress.update(extra)
+    agent_state = {**previous, "status": status.value, "progress": progress}
+    if agent in agent_states and agent_state == previous:
+        return None
+
+    merged = dict(agent_states)
+    merged[agent] = agent_state
+    return merged
+
+
 if SQLALCHEMY_AVAILABLE:
 
     def create_job(session: Session, webhook_url: Optional[str] = None) -> AnalysisJob:
@@ -49,19 +84,11 @@ if SQLALCHEMY_AVAILABLE:
         total: Optional[int] = None,
         extra: Optional[Dict[str, object]] = None,
     ) -> AnalysisJob:
-        agent_states = deepcopy(job.agent_states)
-        agent_state = agent_states.get(agent, {"status": AgentStatus.PENDING.value, "progress": {}})
-        agent_state["status"] = status.value
-        progress = agent_state.setdefault("progress", {})
-        if step is not None:
-            progress["step"] = step
-        if current is not None:
-            progress["current"] = current
-        if total is not None:
-            progress["total"] = total
-        if extra:
-            progress.update(extra)
-        agent_states[agent] = agent_state
+        agent_states = _merge_agent_state(
+            job.agent_states, agent, status, step=step, current=current, total=total, extra=extra
+        )
+        if agent_states is None:
+            return job
 
         session.execute(
             update(AnalysisJob)
@@ -114,19 +141,11 @@ else:
         total: Optional[int] = None,
         extra: Optional[Dict[str, object]] = None,
     ) -> AnalysisJob:
-        agent_states = deepcopy(job.agent_states)
-        agent_state = agent_states.get(agent, {"status": AgentStatus.PENDING.value, "progress": {}})
-        agent_state["status"] = status.value
-        progress = agent_state.setdefault("progress", {})
-        if step is not None:
-            progress["step"] = step
-        if current is not None:
-            progress["current"] = current
-        if total is not None:
-            progress["total"] = total
-        if extra:
-            progress.update(extra)
-        agent_states[agent] = agent_state
+        agent_states = _merge_agent_state(
+            job.agent_states, agent, status, step=step, current=current, total=total, extra=extra
+        )
+        if agent_states is None:
+            return job
         job.agent_states = agent_states
         job.updated_at = datetime.utcnow()
         return job
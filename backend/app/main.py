@@ -1,15 +1,15 @@
 from __future__ import annotations
 
 import hashlib
-import json
 import logging
 import os
 import tempfile
-import uuid
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from pathlib import Path
 from typing import Annotated, Any, Dict, List, Optional
 
-from fastapi import Depends, FastAPI, File, Form, HTTPException, Response, UploadFile, status
+from fastapi import Depends, FastAPI, File, Form, HTTPException, Response, UploadFile
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel, Field
 
@@ -24,6 +24,7 @@ from .auth import (
 from .config import get_settings
 from .middleware import AuditMiddleware, RateLimitMiddleware
 from .services.audit import AuditLogger
+from .services.chat import ChatSessionManager
 from .services.crypto import EncryptedJsonStore, KMSClient, SecretVault
 from .services.data_store import SensitiveDataStore
 from .services.llm import LLMClient
@@ -63,32 +64,17 @@ class ChatSessionRequest(BaseModel):
 
 class ChatMessageRequest(BaseModel):
     message: str
+    client_message_id: Optional[str] = Field(
+        default=None,
+        max_length=128,
+        description="Identificador opcional enviado pelo cliente para reenvios idempotentes.",
+    )
 
 
 class SanitizeRequest(BaseModel):
     records: List[Dict[str, Any]]
 
 
-class ChatSessionManager:
-    def __init__(self) -> None:
-        self.sessions: Dict[str, Dict[str, Any]] = {}
-
-    def create(self, payload: ChatSessionRequest, username: str) -> str:
-        session_id = str(uuid.uuid4())
-        self.sessions[session_id] = {
-            "request": payload,
-            "history": [],
-            "owner": username,
-        }
-        return session_id
-
-    def get(self, session_id: str, username: str) -> Dict[str, Any]:
-        session = self.sessions.get(session_id)
-        if not session or session["owner"] != username:
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Sessão não encontrada.")
-        return session
-
-
 settings = get_settings()
 kms = KMSClient(settings.kms_master_key)
 vault_path = settings.data_dir / settings.vault_name
@@ -125,9 +111,17 @@ llm_client = LLMClient(vault, audit_logger)
 ocr_service = OCRService(audit_logger)
 masker = IdentifierMasker(audit_logger)
 sensitive_store = SensitiveDataStore(settings.data_dir / "sensitive.enc", kms, audit_logger)
-chat_sessions = ChatSessionManager()
+chat_sessions = ChatSessionManager(settings.chat_history_turns)
+
+
+@asynccontextmanager
+async def _lifespan(_app: FastAPI) -> AsyncIterator[None]:
+    yield
+    await llm_client.aclose()
+
+
+app = FastAPI(title="Nexus Quantum Backend", version="1.0.0", lifespan=_lifespan)
 
-app = FastAPI(title="Nexus Quantum Backend", version="1.0.0")
 app.add_middleware(
     CORSMiddleware,
     allow_origins=settings.cors_allow_origins,
@@ -210,18 +204,22 @@ async def send_chat_message(
 ) -> Dict[str, Any]:
     session = chat_sessions.get(session_id, username)
     payload: ChatSessionRequest = session["request"]
-    history: List[Dict[str, str]] = session["history"]
-    response = await llm_client.generate_chat_response(
-        session_id=session_id,
-        history=history,
-        message=request.message,
-        schema=payload.schema,
-        system_instruction=payload.system_instruction,
-        model=payload.model,
+
+    async def respond() -> Dict[str, Any]:
+        return await llm_client.generate_chat_response(
+            session_id=session_id,
+            history=session["history"],
+            message=request.message,
+            schema=payload.schema,
+            system_instruction=payload.system_instruction,
+            model=payload.model,
+        )
+
+    response, deduplicated = await chat_sessions.submit(
+        session, request.message, respond, client_message_id=request.client_message_id
     )
-    history.append({"role": "user", "content": request.message})
-    history.append({"role": "assistant", "content": json.dumps(response)})
-    audit_logger.log("chat", "message.processed", {"session_id": session_id, "username": username})
+    action = "message.deduplicated" if deduplicated else "message.processed"
+    audit_logger.log("chat", action, {"session_id": session_id, "username": username})
     return {"response": response}
 
 
@@ -231,15 +229,17 @@ async def run_ocr(
     username: CurrentUserDep,
 ) -> Dict[str, str]:
     suffix = Path(file.filename or "upload").suffix
+    size = 0
     with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp:
-        content = await file.read()
-        tmp.write(content)
+        while chunk := await file.read(1024 * 1024):
+            tmp.write(chunk)
+            size += len(chunk)
         tmp_path = Path(tmp.name)
     try:
         text = await ocr_service.extract_text(tmp_path)
     finally:
         tmp_path.unlink(missing_ok=True)
-    audit_logger.log("ocr", "extracted", {"username": username, "bytes": len(content)})
+    audit_logger.log("ocr", "extracted", {"username": username, "bytes": size})
     return {"text": text}
 
 
@@ -92,7 +92,7 @@ if SQLALCHEMY_AVAILABLE:
 
 else:
 
-    @dataclass
+    @dataclass(slots=True)
     class AnalysisJob:
         webhook_url: Optional[str] = None
         agent_states: Dict[str, Dict[str, object]] = field(
@@ -106,7 +106,7 @@ else:
         updated_at: datetime = field(default_factory=datetime.utcnow)
 
 
-    @dataclass
+    @dataclass(slots=True)
     class StoredFile:
         job_id: uuid.UUID
         filename: str
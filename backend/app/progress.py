@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import uuid
+from functools import lru_cache
 from typing import Dict, Optional
 
 import httpx
@@ -60,6 +61,18 @@ def set_job_result(
             result_payload=result_payload,
         )
         _send_webhook(job)
+
+
+@lru_cache()
+def _webhook_client() -> httpx.Client:
+    # One pooled client per worker process keeps webhook connections alive
+    # across the many progress updates a single job emits.
+    return httpx.Client(
+        timeout=settings.webhook_timeout_seconds,
+        limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+    )
+
+
 def _send_webhook(job) -> None:
     if not job.webhook_url:
         return
@@ -73,8 +86,7 @@ def _send_webhook(job) -> None:
         payload["result"] = job.result_payload
 
     try:
-        with httpx.Client(timeout=settings.webhook_timeout_seconds) as client:
-            client.post(job.webhook_url, json=payload)
+        _webhook_client().post(job.webhook_url, json=payload)
     except Exception:
         # Webhook failures should not break the pipeline
         pass
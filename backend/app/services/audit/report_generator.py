@@ -53,14 +53,17 @@ class AuditReportGenerator:
             "adjustments_active": sum(len(value) for value in adjustments.values()),
         }
 
-        latency_values = [
-            metric.get("average_latency_ms")
-            for metric in metrics.values()
-            if isinstance(metric, Mapping)
-        ]
-        latency_values = [value for value in latency_values if isinstance(value, (int, float))]
-        if latency_values:
-            summary["average_latency_ms"] = round(sum(latency_values) / len(latency_values), 2)
+        latency_total = 0.0
+        latency_count = 0
+        for metric in metrics.values():
+            if not isinstance(metric, Mapping):
+                continue
+            value = metric.get("average_latency_ms")
+            if isinstance(value, (int, float)):
+                latency_total += value
+                latency_count += 1
+        if latency_count:
+            summary["average_latency_ms"] = round(latency_total / latency_count, 2)
 
         return ScheduledReport(
             schedule=schedule,
@@ -0,0 +1,117 @@
+"""In-memory chat sessions for the LLM chat endpoints."""
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+import uuid
+from collections import deque
+from functools import partial
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from fastapi import HTTPException, status
+
+# A message re-sent with the same client_message_id inside this window is
+# treated as a client retry (e.g. a re-submit after reconnecting) and answered
+# from the previous turn.
+CHAT_RETRY_WINDOW_SECONDS = 30.0
+
+ChatResponder = Callable[[], Awaitable[Dict[str, Any]]]
+
+
+class ChatSessionManager:
+    def __init__(
+        self, history_turns: int = 100, retry_window_seconds: float = CHAT_RETRY_WINDOW_SECONDS
+    ) -> None:
+        self.sessions: Dict[str, Dict[str, Any]] = {}
+        self.history_turns = history_turns
+        self.retry_window_seconds = retry_window_seconds
+
+    def create(self, payload: Any, username: str) -> str:
+        session_id = str(uuid.uuid4())
+        self.sessions[session_id] = {
+            "request": payload,
+            # Bounded so long-lived sessions neither grow without limit nor
+            # resend an ever-growing transcript to the LLM. Each turn is a
+            # user/assistant pair, so eviction always drops whole turns.
+            "history": deque(maxlen=2 * self.history_turns),
+            "owner": username,
+            "inflight": {},
+        }
+        return session_id
+
+    def get(self, session_id: str, username: str) -> Dict[str, Any]:
+        session = self.sessions.get(session_id)
+        if not session or session["owner"] != username:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Sessão não encontrada.")
+        return session
+
+    async def submit(
+        self,
+        session: Dict[str, Any],
+        message: str,
+        respond: ChatResponder,
+        client_message_id: Optional[str] = None,
+    ) -> Tuple[Dict[str, Any], bool]:
+        """Answer ``message``, replaying the reply to client retries.
+
+        Returns the response and whether it was deduplicated. Retries are
+        recognised only by ``client_message_id``: a re-submit with the same id
+        awaits the running turn, or gets the recorded reply within the retry
+        window. Without an id every message is sent to the LLM, since a user
+        may legitimately repeat the same text.
+        """
+        if client_message_id is None:
+            return await self._complete_turn(session, None, message, respond), False
+
+        inflight: Dict[str, asyncio.Task] = session["inflight"]
+        task = inflight.get(client_message_id)
+        if task is not None:
+            return await asyncio.shield(task), True
+
+        last_turn = session.get("last_turn")
+        if (
+            last_turn is not None
+            and last_turn[0] == client_message_id
+            and time.monotonic() - last_turn[1] < self.retry_window_seconds
+        ):
+            return last_turn[2], True
+
+        task = asyncio.create_task(
+            self._complete_turn(session, client_message_id, message, respond)
+        )
+        inflight[client_message_id] = task
+        task.add_done_callback(partial(self._forget_turn, inflight, client_message_id))
+        # Shielded so a disconnecting client does not cancel the turn a retry is waiting on.
+        return await asyncio.shield(task), False
+
+    @staticmethod
+    async def _complete_turn(
+        session: Dict[str, Any],
+        client_message_id: Optional[str],
+        message: str,
+        respond: ChatResponder,
+    ) -> Dict[str, Any]:
+        response = await respond()
+        session["history"].extend(
+            (
+                {"role": "user", "content": message},
+                {
+                    "role": "assistant",
+                    "content": json.dumps(response, ensure_ascii=False, separators=(",", ":")),
+                },
+            )
+        )
+        if client_message_id is not None:
+            session["last_turn"] = (client_message_id, time.monotonic(), response)
+        return response
+
+    @staticmethod
+    def _forget_turn(
+        inflight: Dict[str, asyncio.Task], client_message_id: str, task: asyncio.Task
+    ) -> None:
+        if inflight.get(client_message_id) is task:
+            del inflight[client_message_id]
+        if not task.cancelled():
+            # Retrieved here so a failure nobody is left awaiting is not logged as unhandled.
+            task.exception()
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
+import importlib.util
 import json
 import logging
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Sequence
 
 import httpx
 
@@ -10,6 +11,17 @@ from ..config import get_settings
 from .audit import AuditLogger
 from .crypto import SecretVault
 
+_ORJSON_AVAILABLE = importlib.util.find_spec("orjson") is not None
+# httpx only negotiates HTTP/2 when the optional ``h2`` package is installed.
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+if _ORJSON_AVAILABLE:  # pragma: no cover - exercised in full environments
+    import orjson
+
+    _json_loads = orjson.loads
+else:  # pragma: no cover - lightweight environments
+    _json_loads = json.loads
+
 logger = logging.getLogger(__name__)
 
 
@@ -18,6 +30,18 @@ class LLMClient:
         self.settings = get_settings()
         self.vault = vault
         self.audit_logger = audit_logger
+        self._http: Optional[httpx.AsyncClient] = None
+
+    def _http_client(self) -> httpx.AsyncClient:
+        # Reused across requests so LLM calls share pooled keep-alive connections.
+        if self._http is None or self._http.is_closed:
+            self._http = httpx.AsyncClient(timeout=60, http2=_HTTP2_AVAILABLE)
+        return self._http
+
+    async def aclose(self) -> None:
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
 
     async def _call_llm(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         api_key = self.vault.get_secret(self.settings.gemini_api_key_name)
@@ -31,10 +55,9 @@ class LLMClient:
         endpoint = self.settings.llm_endpoint or "https://generativelanguage.googleapis.com/v1beta/models"
         model = payload.pop("model", self.settings.llm_model)
         url = f"{endpoint}/{model}:generateContent"
-        async with httpx.AsyncClient(timeout=60) as client:
-            response = await client.post(url, json=payload, headers=headers)
-            response.raise_for_status()
-            return response.json()
+        response = await self._http_client().post(url, json=payload, headers=headers)
+        response.raise_for_status()
+        return _json_loads(response.content)
 
     async def generate_structured_response(
         self,
@@ -62,12 +85,12 @@ class LLMClient:
         text = parts[0].get("text")
         if not text:
             raise RuntimeError("LLM response missing text content.")
-        return json.loads(text)
+        return _json_loads(text)
 
     async def generate_chat_response(
         self,
         session_id: str,
-        history: list[Dict[str, str]],
+        history: Sequence[Dict[str, str]],
         message: str,
         schema: Dict[str, Any],
         system_instruction: str,
@@ -97,4 +120,4 @@ class LLMClient:
         text = parts[0].get("text")
         if not text:
             raise RuntimeError("LLM chat response missing text.")
-        return json.loads(text)
+        return _json_loads(text)
@@ -3,21 +3,31 @@ from __future__ import annotations
 import asyncio
 from pathlib import Path
 
-import pytesseract
-from PIL import Image
-
 from ..config import get_settings
 from .audit import AuditLogger
 
 
+def _image_to_string(image_path: Path, language: str) -> str:
+    # Imported on first use so API startup does not pay for Pillow/pytesseract.
+    import pytesseract
+    from PIL import Image
+
+    with Image.open(image_path) as image:
+        return pytesseract.image_to_string(image, lang=language)
+
+
 class OCRService:
     def __init__(self, audit_logger: AuditLogger) -> None:
         self.settings = get_settings()
         self.audit_logger = audit_logger
+        # Tesseract is CPU-bound; bound concurrent extractions so a burst of
+        # uploads queues here instead of saturating the executor.
+        self._slots = asyncio.Semaphore(max(1, self.settings.ocr_max_concurrency))
 
     async def extract_text(self, image_path: Path) -> str:
         loop = asyncio.get_running_loop()
         language = self.settings.ocr_language
-        text = await loop.run_in_executor(None, lambda: pytesseract.image_to_string(Image.open(image_path), lang=language))
+        async with self._slots:
+            text = await loop.run_in_executor(None, _image_to_string, image_path, language)
         self.audit_logger.log("ocr_service", "ocr.extract", {"language": language})
         return text
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import secrets
+import shutil
 from typing import Iterable, List, Tuple
 
 from fastapi import UploadFile
@@ -12,6 +13,8 @@ from ..models import StoredFile
 
 settings = get_settings()
 
+_COPY_CHUNK_SIZE = 1024 * 1024
+
 ALLOWED_CONTENT_TYPES = {
     "application/pdf",
     "text/csv",
@@ -42,8 +45,8 @@ def store_uploads(job_id, files: Iterable[UploadFile]) -> List[StoredFile]:
 
             safe_name = _safe_filename(upload.filename or "arquivo")
             target_path = base_path / safe_name
-            data = upload.file.read()
-            target_path.write_bytes(data)
+            with target_path.open("wb") as destination:
+                shutil.copyfileobj(upload.file, destination, _COPY_CHUNK_SIZE)
 
             stored_file = StoredFile(
                 job_id=job_id,
@@ -3,12 +3,19 @@ from __future__ import annotations
 import datetime as dt
 import json
 import uuid
+from collections import OrderedDict
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 EXPORT_ROOT = Path("exports")
 EXPORT_ROOT.mkdir(parents=True, exist_ok=True)
 
+# LRU of parsed bundles keyed by id and validated against the file's mtime and
+# size, so repeated downloads and full exports do not re-read and re-parse
+# unchanged files. Bounded so long-running processes do not keep every bundle.
+_BUNDLE_CACHE_MAX_ENTRIES = 64
+_BUNDLE_CACHE: OrderedDict[str, Tuple[Tuple[int, int], Dict[str, Any]]] = OrderedDict()
+
 
 def _bundle_path(bundle_id: str) -> Path:
     return EXPORT_ROOT / f"{bundle_id}.json"
@@ -29,13 +36,32 @@ def save_bundle(payload: Dict[str, Any]) -> str:
 
 
 def load_bundle(bundle_id: str) -> Optional[Dict[str, Any]]:
+    """Return the parsed bundle, or ``None`` if it is missing or unreadable.
+
+    The returned dict is shared with the bundle cache and must be treated as
+    read-only by callers.
+    """
     path = _bundle_path(bundle_id)
-    if not path.exists():
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        _BUNDLE_CACHE.pop(bundle_id, None)
         return None
+    version = (stat.st_mtime_ns, stat.st_size)
+    cached = _BUNDLE_CACHE.get(bundle_id)
+    if cached is not None and cached[0] == version:
+        _BUNDLE_CACHE.move_to_end(bundle_id)
+        return cached[1]
     try:
-        return json.loads(path.read_text(encoding="utf-8"))
+        bundle = json.loads(path.read_text(encoding="utf-8"))
     except json.JSONDecodeError:
+        _BUNDLE_CACHE.pop(bundle_id, None)
         return None
+    _BUNDLE_CACHE[bundle_id] = (version, bundle)
+    _BUNDLE_CACHE.move_to_end(bundle_id)
+    while len(_BUNDLE_CACHE) > _BUNDLE_CACHE_MAX_ENTRIES:
+        _BUNDLE_CACHE.popitem(last=False)
+    return bundle
 
 
 def list_bundles() -> List[str]:
@@ -96,8 +96,7 @@ def _build_progress_extra(message: MessageEnvelope[Any]) -> Dict[str, Any]:
     if isinstance(payload, RawDataPayload):
         extra["documentId"] = payload.document_id
         extra["stage"] = payload.stage
-        data = dict(payload.data)
-        totals = data.get("totals")
+        totals = payload.data.get("totals")
         if totals:
             extra["totals"] = totals
         if payload.metadata:
@@ -1,4 +1,4 @@
 """Utility helpers for backend app."""
-from .pydantic import model_dump
+from .pydantic import model_dump, model_dump_json
 
-__all__ = ["model_dump"]
+__all__ = ["model_dump", "model_dump_json"]
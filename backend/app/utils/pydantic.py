@@ -12,3 +12,13 @@ def model_dump(model: Any) -> MutableMapping[str, Any]:
     if hasattr(model, "dict"):
         return model.dict()  # type: ignore[return-value]
     raise AttributeError(f"Object {type(model)!r} does not support model_dump/dict")
+
+
+def model_dump_json(model: Any) -> bytes:
+    """Return the UTF-8 JSON encoding of a model regardless of Pydantic version."""
+
+    if hasattr(model, "model_dump_json"):
+        return model.model_dump_json().encode("utf-8")  # type: ignore[no-any-return]
+    if hasattr(model, "json"):
+        return model.json().encode("utf-8")  # type: ignore[no-any-return]
+    raise AttributeError(f"Object {type(model)!r} does not support model_dump_json/json")
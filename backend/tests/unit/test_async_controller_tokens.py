@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+from decimal import Decimal
+from typing import List
+
+from pydantic import BaseModel
+from services.orchestrator.async_controller import AsyncAgentController
+
+from app.utils import model_dump_json
+
+
+class _Totals(BaseModel):
+    grand_total: Decimal
+    items: List[str]
+
+
+def test_rough_token_count_memoizes_models_per_call() -> None:
+    controller = AsyncAgentController.__new__(AsyncAgentController)
+    model = _Totals(grand_total=Decimal("10.50"), items=["item"] * 20)
+    cache: dict[int, int] = {}
+
+    count = controller._rough_token_count(model, cache)
+
+    assert count == len(model_dump_json(model)) // 4
+    assert cache == {id(model): count}
+    assert controller._rough_token_count([model, model], cache) == 2 * count
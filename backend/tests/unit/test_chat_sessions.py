@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Dict
+
+import pytest
+
+from app.services.chat import ChatSessionManager
+
+
+class _CountingResponder:
+    def __init__(self) -> None:
+        self.calls = 0
+        self.release = asyncio.Event()
+
+    async def __call__(self) -> Dict[str, Any]:
+        self.calls += 1
+        await self.release.wait()
+        return {"answer": self.calls}
+
+
+def test_resubmit_while_in_flight_awaits_the_running_turn() -> None:
+    async def scenario() -> None:
+        manager = ChatSessionManager(history_turns=5)
+        session = manager.get(manager.create({"schema": {}}, "user"), "user")
+        responder = _CountingResponder()
+
+        first = asyncio.create_task(
+            manager.submit(session, "olá", responder, client_message_id="m-1")
+        )
+        await asyncio.sleep(0)
+        retry = asyncio.create_task(
+            manager.submit(session, "olá", responder, client_message_id="m-1")
+        )
+        await asyncio.sleep(0)
+        responder.release.set()
+
+        assert await first == ({"answer": 1}, False)
+        assert await retry == ({"answer": 1}, True)
+        assert responder.calls == 1
+        assert [turn["role"] for turn in session["history"]] == ["user", "assistant"]
+        assert session["inflight"] == {}
+
+    asyncio.run(scenario())
+
+
+def test_resubmit_after_completion_reuses_the_previous_turn() -> None:
+    async def scenario() -> None:
+        manager = ChatSessionManager(history_turns=5)
+        session = manager.get(manager.create({"schema": {}}, "user"), "user")
+        responder = _CountingResponder()
+        responder.release.set()
+
+        first = await manager.submit(session, "olá", responder, client_message_id="m-1")
+        retry = await manager.submit(session, "olá", responder, client_message_id="m-1")
+        repeat = await manager.submit(session, "olá", responder, client_message_id="m-2")
+
+        assert first == ({"answer": 1}, False)
+        assert retry == ({"answer": 1}, True)
+        assert repeat == ({"answer": 2}, False)
+        assert responder.calls == 2
+        assert len(session["history"]) == 4
+
+    asyncio.run(scenario())
+
+
+def test_repeated_text_without_client_id_always_reaches_the_llm() -> None:
+    async def scenario() -> None:
+        manager = ChatSessionManager(history_turns=5)
+        session = manager.get(manager.create({"schema": {}}, "user"), "user")
+        responder = _CountingResponder()
+        responder.release.set()
+
+        assert await manager.submit(session, "sim", responder) == ({"answer": 1}, False)
+        assert await manager.submit(session, "sim", responder) == ({"answer": 2}, False)
+
+        assert responder.calls == 2
+        assert [turn["content"] for turn in session["history"]][::2] == ["sim", "sim"]
+        assert "last_turn" not in session
+
+    asyncio.run(scenario())
+
+
+def test_failed_turn_is_not_cached() -> None:
+    async def scenario() -> None:
+        manager = ChatSessionManager(history_turns=5)
+        session = manager.get(manager.create({"schema": {}}, "user"), "user")
+
+        async def failing() -> Dict[str, Any]:
+            raise RuntimeError("llm unavailable")
+
+        with pytest.raises(RuntimeError, match="llm unavailable"):
+            await manager.submit(session, "olá", failing, client_message_id="m-1")
+
+        assert session["inflight"] == {}
+        assert "last_turn" not in session
+        assert len(session["history"]) == 0
+
+    asyncio.run(scenario())
+
+
+def test_history_evicts_whole_turns() -> None:
+    async def scenario() -> None:
+        manager = ChatSessionManager(history_turns=2)
+        session = manager.get(manager.create({"schema": {}}, "user"), "user")
+        responder = _CountingResponder()
+        responder.release.set()
+
+        for message in ("um", "dois", "três"):
+            await manager.submit(session, message, responder)
+
+        assert [turn["role"] for turn in session["history"]] == ["user", "assistant"] * 2
+        assert session["history"][0]["content"] == "dois"
+
+    asyncio.run(scenario())
@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+from app.crud import _merge_agent_state
+from app.models import AgentStatus
+
+
+def test_merge_agent_state_patches_only_the_target_agent() -> None:
+    states = {
+        "ocr": {"status": "pending", "progress": {"step": "Aguardando", "current": 0, "total": 0}},
+        "auditor": {"status": "pending", "progress": {}},
+    }
+
+    merged = _merge_agent_state(
+        states, "ocr", AgentStatus.RUNNING, step="Lendo", current=1, total=3, extra=None
+    )
+
+    assert merged is not None
+    assert merged["ocr"] == {
+        "status": "running",
+        "progress": {"step": "Lendo", "current": 1, "total": 3},
+    }
+    assert merged["auditor"] is states["auditor"]
+    assert states["ocr"]["progress"]["current"] == 0
+
+
+def test_merge_agent_state_returns_none_when_unchanged() -> None:
+    states = {"auditor": {"status": "running", "progress": {"step": "Validando"}}}
+
+    unchanged = _merge_agent_state(
+        states,
+        "auditor",
+        AgentStatus.RUNNING,
+        step="Validando",
+        current=None,
+        total=None,
+        extra=None,
+    )
+    added = _merge_agent_state(
+        states, "classifier", AgentStatus.PENDING, step=None, current=None, total=None, extra=None
+    )
+
+    assert unchanged is None
+    assert added == {**states, "classifier": {"status": "pending", "progress": {}}}
@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+from decimal import Decimal
+
+from services.orchestrator.schemas import MessageEnvelope, RawDataPayload
+
+
+def _raw_envelope() -> MessageEnvelope[RawDataPayload]:
+    return MessageEnvelope(
+        agent="extractor",
+        kind="raw",
+        payload=RawDataPayload(
+            document_id="doc-01",
+            stage="extraction",
+            data={"totals": {"grand_total": Decimal("10.50")}},
+        ),
+        tokens=12,
+    )
+
+
+def test_message_envelope_is_slotted() -> None:
+    envelope = _raw_envelope()
+
+    assert not hasattr(envelope, "__dict__")
+
+
+def test_message_envelope_to_dict_keeps_payload_values() -> None:
+    envelope = _raw_envelope()
+
+    data = envelope.to_dict()
+
+    assert data["agent"] == "extractor"
+    assert data["tokens"] == 12
+    assert data["timestamp"] == envelope.timestamp.isoformat()
+    assert data["payload"] == {
+        "documentId": "doc-01",
+        "stage": "extraction",
+        "data": {"totals": {"grand_total": Decimal("10.50")}},
+    }
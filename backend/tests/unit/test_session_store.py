@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import json
+import os
+
+import pytest
+
+from app.storage import session_store
+
+
+@pytest.fixture(autouse=True)
+def _isolated_store(tmp_path, monkeypatch):
+    monkeypatch.setattr(session_store, "EXPORT_ROOT", tmp_path)
+    monkeypatch.setattr(session_store, "_BUNDLE_CACHE", session_store.OrderedDict())
+
+
+def test_load_bundle_reparses_after_file_changes() -> None:
+    bundle_id = session_store.save_bundle({"note": "v1"})
+    path = session_store._bundle_path(bundle_id)
+
+    first = session_store.load_bundle(bundle_id)
+    assert first is not None and first["note"] == "v1"
+    assert session_store.load_bundle(bundle_id) is first
+
+    path.write_text(json.dumps({"bundle_id": bundle_id, "note": "v2"}), encoding="utf-8")
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    second = session_store.load_bundle(bundle_id)
+    assert second is not None and second["note"] == "v2"
+
+    path.unlink()
+    assert session_store.load_bundle(bundle_id) is None
+    assert bundle_id not in session_store._BUNDLE_CACHE
+
+
+def test_bundle_cache_evicts_least_recently_used(monkeypatch) -> None:
+    monkeypatch.setattr(session_store, "_BUNDLE_CACHE_MAX_ENTRIES", 2)
+    first, second, third = (session_store.save_bundle({"index": index}) for index in range(3))
+
+    session_store.load_bundle(first)
+    session_store.load_bundle(second)
+    session_store.load_bundle(first)
+    session_store.load_bundle(third)
+
+    assert list(session_store._BUNDLE_CACHE) == [first, third]
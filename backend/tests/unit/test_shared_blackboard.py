@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import asyncio
+import gc
+
+from services.orchestrator.async_controller import SharedBlackboard, SubscriberQueue
+from services.orchestrator.schemas import SemanticSummaryPayload
+
+
+def _summary(index: int) -> SemanticSummaryPayload:
+    return SemanticSummaryPayload(document_id=f"doc-{index}", stage="audit", summary=str(index))
+
+
+def _drain(queue: asyncio.Queue) -> list:
+    items = []
+    while not queue.empty():
+        items.append(queue.get_nowait())
+        queue.task_done()
+    return items
+
+
+def test_subscriber_queue_evicts_oldest_when_full() -> None:
+    queue = SubscriberQueue(maxsize=2)
+
+    for item in ("first", "second", "third"):
+        queue.offer(item)  # type: ignore[arg-type]
+
+    assert queue.dropped == 1
+    assert _drain(queue) == ["second", "third"]
+
+
+def test_queue_join_completes_after_eviction() -> None:
+    async def scenario() -> None:
+        queue = SubscriberQueue(maxsize=2)
+        for item in ("first", "second", "third", "fourth"):
+            queue.offer(item)  # type: ignore[arg-type]
+
+        consumed = _drain(queue)
+
+        await asyncio.wait_for(queue.join(), timeout=1)
+        assert consumed == ["third", "fourth"]
+        assert queue.dropped == 2
+
+    asyncio.run(scenario())
+
+
+def test_finalize_delivers_sentinel_last() -> None:
+    async def scenario() -> None:
+        blackboard = SharedBlackboard()
+        queue = blackboard.subscribe(maxsize=2)
+        for index in range(3):
+            await blackboard.publish_summary("auditor", _summary(index))
+
+        await blackboard.finalize()
+        await blackboard.finalize()
+
+        items = _drain(queue)
+        # Making room for the sentinel evicts the oldest pending message.
+        assert queue.dropped == 2
+        assert [item.payload.summary for item in items[:-1]] == ["2"]
+        assert items[-1] is None
+
+    asyncio.run(scenario())
+
+
+def test_collected_subscriber_is_pruned() -> None:
+    async def scenario() -> None:
+        blackboard = SharedBlackboard()
+        kept = blackboard.subscribe()
+        blackboard.subscribe()
+        gc.collect()
+
+        assert [ref() for ref in blackboard._subscribers] == [kept]
+        await blackboard.publish_summary("auditor", _summary(0))
+        assert kept.qsize() == 1
+
+        blackboard.unsubscribe(kept)
+        assert blackboard._subscribers == ()
+
+    asyncio.run(scenario())
@@ -1,7 +1,8 @@
 """Asynchronous controller orchestrating cache-aware hybrid agent execution."""
 from __future__ import annotations
 
-import inspect
+import asyncio
+import types
 from dataclasses import dataclass
 from typing import Awaitable, Callable, Mapping, MutableMapping, Optional, Sequence
 
@@ -14,6 +15,8 @@ from .prompt_optimizer import ChainPlan, PromptOptimizer
 LLMCallable = Callable[[str, ChainPlan], Awaitable[object] | object]
 EmbeddingCallable = Callable[[Sequence[PreprocessedDocument]], Awaitable[Mapping[str, object]] | Mapping[str, object]]
 
+_AWAITABLE_TYPES = (types.CoroutineType, asyncio.Future)
+
 
 @dataclass(frozen=True)
 class AsyncAgentExecutionResult:
@@ -114,8 +117,8 @@ class AsyncAgentController:
         )
 
     async def _resolve(self, value: Awaitable[object] | Mapping[str, object] | object) -> object:
-        if inspect.isawaitable(value):
-            return await value  # type: ignore[return-value]
+        if isinstance(value, _AWAITABLE_TYPES) or hasattr(value, "__await__"):
+            return await value  # type: ignore[return-value,misc]
         return value
 
     def _response_cache_key(self, fingerprint: str) -> str:
@@ -85,6 +85,8 @@ class ConsistencyChecker:
                     continue
 
                 delta = candidate_value - base_value
+                if abs(delta) <= self.tolerance * abs(base_value):
+                    continue
                 pct_delta = self._calculate_percentage_delta(base_value, candidate_value)
                 if pct_delta > self.tolerance:
                     differences.append(
@@ -98,8 +100,10 @@ class ConsistencyChecker:
                         )
                     )
 
-        for record_id in cand.keys() - base.keys():
-            for metric, value in cand[record_id].items():
+        for record_id, candidate_metrics in cand.items():
+            if record_id in base:
+                continue
+            for metric, value in candidate_metrics.items():
                 differences.append(
                     Difference(record_id, metric, 0.0, value, value, math.inf)
                 )
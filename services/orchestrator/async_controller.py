@@ -2,9 +2,27 @@
 from __future__ import annotations
 
 import asyncio
-import time
-from functools import partial
-from typing import Any, Awaitable, Callable, Dict, List, Mapping, Optional, Sequence
+import os
+import threading
+import weakref
+from asyncio import get_running_loop
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property, partial
+from operator import attrgetter
+from time import perf_counter
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+)
 
 from backend.app.agents.accountant import AccountantAgent
 from backend.app.core.totals import ensure_document_totals
@@ -20,7 +38,7 @@ from backend.app.schemas import (
     InsightReport,
 )
 from backend.app.services.diagnostic_logger import log_totals_event, update_post_validation_benchmark
-from backend.app.utils import model_dump
+from backend.app.utils import model_dump, model_dump_json
 
 from services.agents.efficiency_guard import EfficiencyGuardAgent
 
@@ -35,17 +53,121 @@ from .schemas import (
 BeforeHook = Callable[[str, Mapping[str, Any]], Awaitable[None]]
 AfterHook = Callable[[str, Mapping[str, Any]], Awaitable[None]]
 
+DEFAULT_SUBSCRIBER_CAPACITY = 256
+
+# Stages are routed to separate thread pools so slow I/O-bound agents (file
+# extraction, database lookups, LLM calls) never hold the threads needed by the
+# CPU-bound ones. The pools are shared by every controller in the process.
+_STAGE_POOLS = {
+    "extraction": "io",
+    "corrections": "io",
+    "post_validation": "io",
+    "insight": "io",
+    "audit": "compute",
+    "classification": "compute",
+    "accounting": "compute",
+    "consistency": "compute",
+}
+_POOL_SIZES = {
+    "io": min(32, (os.cpu_count() or 1) + 4),
+    "compute": os.cpu_count() or 1,
+}
+_executors: Dict[str, ThreadPoolExecutor] = {}
+_executors_lock = threading.Lock()
+
+
+def _executor_for(stage: str) -> Optional[ThreadPoolExecutor]:
+    pool = _STAGE_POOLS.get(stage)
+    if pool is None:
+        return None
+    executor = _executors.get(pool)
+    if executor is None:
+        with _executors_lock:
+            executor = _executors.get(pool)
+            if executor is None:
+                executor = ThreadPoolExecutor(
+                    max_workers=_POOL_SIZES[pool], thread_name_prefix=f"agent-{pool}"
+                )
+                _executors[pool] = executor
+    return executor
+
+
+_audit_issue_fields = attrgetter("code", "message", "severity")
+_insight_reference_fields = attrgetter("description", "exists")
+
+
+class SubscriberQueue(asyncio.Queue["MessageEnvelope[Any] | None"]):
+    """Bounded subscriber queue that evicts its oldest message when full."""
+
+    def __init__(self, maxsize: int = DEFAULT_SUBSCRIBER_CAPACITY) -> None:
+        super().__init__(maxsize=maxsize)
+        self.dropped: int = 0
+
+    def offer(self, item: MessageEnvelope[Any] | None) -> None:
+        try:
+            self.put_nowait(item)
+        except asyncio.QueueFull:
+            self.get_nowait()
+            self.task_done()
+            self.dropped += 1
+            self.put_nowait(item)
+
+
+class _BeforeHookPayload(Mapping[str, Any]):
+    """Before-hook context whose ``args``/``kwargs`` digests are built on first access."""
+
+    _keys = ("stage", "document_id", "args", "kwargs")
+
+    def __init__(
+        self,
+        stage: str,
+        document_id: Optional[str],
+        args: Sequence[Any],
+        kwargs: Mapping[str, Any],
+        shrink: Callable[[Any], Any],
+    ) -> None:
+        self.stage = stage
+        self.document_id = document_id
+        self._args = args
+        self._kwargs = kwargs
+        self._shrink = shrink
+
+    @cached_property
+    def args(self) -> Any:
+        return self._shrink(self._args)
+
+    @cached_property
+    def kwargs(self) -> Any:
+        return self._shrink(self._kwargs)
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self._keys:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._keys)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
 
 class SharedBlackboard:
     """Lightweight async blackboard used to share agent outputs."""
 
-    def __init__(self) -> None:
-        self._lock = asyncio.Lock()
-        self._raw: List[MessageEnvelope[RawDataPayload]] = []
-        self._summaries: List[MessageEnvelope[SemanticSummaryPayload]] = []
-        self._insights: List[MessageEnvelope[FinalInsightPayload]] = []
-        self._subscribers: set[asyncio.Queue[MessageEnvelope[Any] | None]] = set()
-        self._finalized = False
+    def __init__(self, *, history_limit: Optional[int] = 1024) -> None:
+        self._raw: Deque[MessageEnvelope[RawDataPayload]] = deque(maxlen=history_limit)
+        self._summaries: Deque[MessageEnvelope[SemanticSummaryPayload]] = deque(maxlen=history_limit)
+        self._insights: Deque[MessageEnvelope[FinalInsightPayload]] = deque(maxlen=history_limit)
+        self._buckets: Dict[str, Deque[MessageEnvelope[Any]]] = {
+            "raw": self._raw,
+            "summary": self._summaries,
+            "insight": self._insights,
+        }
+        # Copy-on-write: publishers read the tuple as-is, (un)subscribe replace it.
+        # Only weak references are kept, so a consumer that goes away without
+        # unsubscribing is dropped once its queue is garbage collected.
+        self._subscribers: tuple[weakref.ref[SubscriberQueue], ...] = ()
         self._finalized_event = asyncio.Event()
 
     async def publish_raw(
@@ -109,45 +231,44 @@ class SharedBlackboard:
         return envelope
 
     async def _store_and_broadcast(self, envelope: MessageEnvelope[Any]) -> None:
-        async with self._lock:
-            if envelope.kind == "raw":
-                self._raw.append(envelope)
-            elif envelope.kind == "summary":
-                self._summaries.append(envelope)  # type: ignore[arg-type]
-            else:
-                self._insights.append(envelope)  # type: ignore[arg-type]
-            subscribers = list(self._subscribers)
-        for queue in subscribers:
-            await queue.put(envelope)
-
-    def subscribe(self) -> asyncio.Queue[MessageEnvelope[Any] | None]:
-        queue: asyncio.Queue[MessageEnvelope[Any] | None] = asyncio.Queue()
-        self._subscribers.add(queue)
+        # Appends and the subscriber snapshot run without awaiting, so they are
+        # atomic with respect to other coroutines on the loop.
+        self._buckets[envelope.kind].append(envelope)
+        # Slow subscribers lose their oldest messages instead of blocking the publisher.
+        for ref in self._subscribers:
+            queue = ref()
+            if queue is not None:
+                queue.offer(envelope)
+
+    def subscribe(self, maxsize: int = DEFAULT_SUBSCRIBER_CAPACITY) -> SubscriberQueue:
+        queue = SubscriberQueue(maxsize=maxsize)
+        self._subscribers = self._subscribers + (weakref.ref(queue, self._discard_ref),)
         return queue
 
     def unsubscribe(self, queue: asyncio.Queue[MessageEnvelope[Any] | None]) -> None:
-        self._subscribers.discard(queue)
+        self._subscribers = tuple(ref for ref in self._subscribers if ref() is not queue)
+
+    def _discard_ref(self, dead: weakref.ref[SubscriberQueue]) -> None:
+        self._subscribers = tuple(ref for ref in self._subscribers if ref is not dead)
 
     async def finalize(self) -> None:
-        async with self._lock:
-            if self._finalized:
-                return
-            self._finalized = True
-            subscribers = list(self._subscribers)
-        for queue in subscribers:
-            await queue.put(None)
+        if self._finalized_event.is_set():
+            return
         self._finalized_event.set()
+        for ref in self._subscribers:
+            queue = ref()
+            if queue is not None:
+                queue.offer(None)
 
     async def wait_finalized(self) -> None:
         await self._finalized_event.wait()
 
     async def snapshot(self) -> BlackboardSnapshot:
-        async with self._lock:
-            return BlackboardSnapshot(
-                raw_data=list(self._raw),
-                semantic_summaries=list(self._summaries),
-                insights=list(self._insights),
-            )
+        return BlackboardSnapshot(
+            raw_data=list(self._raw),
+            semantic_summaries=list(self._summaries),
+            insights=list(self._insights),
+        )
 
 
 class AsyncAgentController:
@@ -178,14 +299,14 @@ class AsyncAgentController:
         self._after_hooks.append(hook)
 
     async def run(self, document_in: DocumentIn) -> PipelineRunResult:
+        corrections_future: Optional[asyncio.Future[Dict[str, str]]] = None
         try:
             document, doc_tokens, doc_latency = await self._run_agent(
                 "extractor",
-                self.extractor.run,
+                self._extract_document,
                 document_in,
                 stage="extraction",
             )
-            document = self._ensure_document_totals(document)
             await self.blackboard.publish_raw(
                 "extractor",
                 RawDataPayload(
@@ -198,6 +319,12 @@ class AsyncAgentController:
                 latency_ms=doc_latency,
             )
 
+            # Corrections come from the database; load them while the auditor runs.
+            corrections_future = get_running_loop().run_in_executor(
+                _executor_for("corrections"),
+                self._load_corrections,
+                getattr(document_in, "metadata", {}),
+            )
             audit, audit_tokens, audit_latency = await self._run_agent(
                 "auditor", self.auditor.run, document, stage="audit"
             )
@@ -208,7 +335,7 @@ class AsyncAgentController:
                 latency_ms=audit_latency,
             )
 
-            corrections = self._load_corrections(getattr(document_in, "metadata", {}))
+            corrections = await corrections_future
             classification, class_tokens, class_latency = await self._run_agent(
                 "classifier",
                 self.classifier.run,
@@ -226,7 +353,14 @@ class AsyncAgentController:
             accounting, acc_tokens, acc_latency = await self._run_agent(
                 "accountant", self.accountant.run, classification, stage="accounting"
             )
-            await self._handle_accounting_totals(document_in, accounting)
+            # Kept out of the timed call: the benchmark write is file I/O that must
+            # not count towards the accountant's latency or hold a compute thread.
+            await get_running_loop().run_in_executor(
+                _executor_for("post_validation"),
+                self._handle_accounting_totals,
+                document_in.document_id,
+                accounting,
+            )
             await self.blackboard.publish_summary(
                 "accountant",
                 self._build_accounting_summary(accounting),
@@ -251,7 +385,10 @@ class AsyncAgentController:
             )
 
             insight, insight_tokens, insight_latency = await self._run_agent(
-                "intelligence", self.intelligence.run, accounting, stage="insight"
+                "intelligence",
+                self.intelligence.run,
+                accounting,
+                stage="insight",
             )
             await self.blackboard.publish_insight(
                 "intelligence",
@@ -269,6 +406,12 @@ class AsyncAgentController:
                 insight=insight,
             )
         finally:
+            if corrections_future is not None:
+                if not corrections_future.done():
+                    corrections_future.cancel()
+                elif not corrections_future.cancelled():
+                    # Mark a failure as retrieved when an earlier stage already raised.
+                    corrections_future.exception()
             await self.blackboard.finalize()
 
     async def _run_agent(
@@ -279,13 +422,20 @@ class AsyncAgentController:
         stage: str,
         **kwargs: Any,
     ) -> tuple[Any, Optional[int], Optional[float]]:
-        await self._notify_before(agent_name, stage, args, kwargs)
-        loop = asyncio.get_running_loop()
-        call = partial(func, *args, **kwargs)
-        start = time.perf_counter()
-        result = await loop.run_in_executor(None, call)
-        latency_ms = (time.perf_counter() - start) * 1000
-        tokens = self._estimate_tokens(args, kwargs, result)
+        # Per-call memo of serialized models, keyed by id(); the objects stay alive
+        # for the whole call so ids cannot be reused while the caches exist.
+        dumps: Dict[int, Any] = {}
+        token_counts: Dict[int, int] = {}
+        await self._notify_before(agent_name, stage, args, kwargs, dumps)
+        loop = get_running_loop()
+        executor = _executor_for(stage)
+        start = perf_counter()
+        if kwargs:
+            result = await loop.run_in_executor(executor, partial(func, *args, **kwargs))
+        else:
+            result = await loop.run_in_executor(executor, func, *args)
+        latency_ms = (perf_counter() - start) * 1000
+        tokens = self._estimate_tokens(args, kwargs, result, token_counts)
         await self._notify_after(agent_name, stage, result, tokens, latency_ms)
         return result, tokens, latency_ms
 
@@ -295,16 +445,18 @@ class AsyncAgentController:
         stage: str,
         args: Sequence[Any],
         kwargs: Mapping[str, Any],
+        dumps: Dict[int, Any],
     ) -> None:
         if not self._before_hooks:
             return
-        payload = {
-            "stage": stage,
-            "document_id": self._extract_document_id(args),
-            "args": self._shrink_payload(args),
-            "kwargs": self._shrink_payload(kwargs),
-        }
-        await asyncio.gather(*(hook(agent_name, payload) for hook in self._before_hooks))
+        payload = _BeforeHookPayload(
+            stage,
+            self._extract_document_id(args),
+            args,
+            kwargs,
+            partial(self._shrink_payload, dumps=dumps),
+        )
+        await self._dispatch_hooks(self._before_hooks, agent_name, payload)
 
     async def _notify_after(
         self,
@@ -322,28 +474,87 @@ class AsyncAgentController:
             "tokens": tokens,
             "latency_ms": latency_ms,
         }
-        await asyncio.gather(*(hook(agent_name, payload) for hook in self._after_hooks))
+        await self._dispatch_hooks(self._after_hooks, agent_name, payload)
+
+    @staticmethod
+    async def _dispatch_hooks(
+        hooks: Sequence[Callable[[str, Mapping[str, Any]], Awaitable[None]]],
+        agent_name: str,
+        payload: Mapping[str, Any],
+    ) -> None:
+        if len(hooks) == 1:
+            await hooks[0](agent_name, payload)
+            return
+        async with asyncio.TaskGroup() as group:
+            for hook in hooks:
+                group.create_task(hook(agent_name, payload))
 
-    def _estimate_tokens(self, args: Sequence[Any], kwargs: Mapping[str, Any], result: Any) -> int:
+    def _estimate_tokens(
+        self,
+        args: Sequence[Any],
+        kwargs: Mapping[str, Any],
+        result: Any,
+        cache: Dict[int, int],
+    ) -> int:
         total = 0
         for item in list(args) + [kwargs, result]:
-            total += self._rough_token_count(item)
+            total += self._rough_token_count(item, cache)
         return total
 
-    def _rough_token_count(self, value: Any) -> int:
-        if value is None:
-            return 0
+    def _rough_token_count(self, value: Any, cache: Dict[int, int]) -> int:
+        counter = self._token_counters.get(type(value))
+        if counter is not None:
+            return counter(self, value, cache)
         if isinstance(value, str):
-            return max(1, len(value) // 4)
+            return self._count_text(value, cache)
         if isinstance(value, Mapping):
-            return sum(self._rough_token_count(k) + self._rough_token_count(v) for k, v in value.items())
+            return self._count_mapping(value, cache)
         if isinstance(value, (list, tuple, set)):
-            return sum(self._rough_token_count(item) for item in value)
-        if hasattr(value, "model_dump"):
-            return self._rough_token_count(value.model_dump())
+            return self._count_items(value, cache)
+        # Pydantic v2 exposes model_dump_json, v1 json + dict; both go through
+        # the compat helper so the memoized estimate applies to either version.
+        if hasattr(value, "model_dump_json") or (hasattr(value, "json") and hasattr(value, "dict")):
+            key = id(value)
+            cached = cache.get(key)
+            if cached is None:
+                cached = max(1, len(model_dump_json(value)) // 4)
+                cache[key] = cached
+            return cached
         if hasattr(value, "dict"):
-            return self._rough_token_count(value.dict())  # type: ignore[call-arg]
-        return self._rough_token_count(str(value))
+            return self._rough_token_count(value.dict(), cache)  # type: ignore[call-arg]
+        return self._count_text(str(value), cache)
+
+    def _count_none(self, value: None, cache: Dict[int, int]) -> int:
+        return 0
+
+    def _count_text(self, value: str, cache: Dict[int, int]) -> int:
+        return max(1, len(value) // 4)
+
+    def _count_scalar(self, value: Any, cache: Dict[int, int]) -> int:
+        return max(1, len(str(value)) // 4)
+
+    def _count_mapping(self, value: Mapping[Any, Any], cache: Dict[int, int]) -> int:
+        return sum(
+            self._rough_token_count(k, cache) + self._rough_token_count(v, cache)
+            for k, v in value.items()
+        )
+
+    def _count_items(self, value: Any, cache: Dict[int, int]) -> int:
+        return sum(self._rough_token_count(item, cache) for item in value)
+
+    # Exact-type dispatch for the common JSON-like values; subclasses and models
+    # fall through to the isinstance checks in _rough_token_count.
+    _token_counters: Dict[type, Callable[..., int]] = {
+        type(None): _count_none,
+        str: _count_text,
+        int: _count_scalar,
+        float: _count_scalar,
+        bool: _count_scalar,
+        dict: _count_mapping,
+        list: _count_items,
+        tuple: _count_items,
+        set: _count_items,
+    }
 
     def _extract_document_id(self, args: Sequence[Any]) -> Optional[str]:
         for item in args:
@@ -353,29 +564,39 @@ class AsyncAgentController:
                     return doc_id
         return None
 
-    def _shrink_payload(self, data: Any) -> Any:
+    def _shrink_payload(self, data: Any, dumps: Dict[int, Any]) -> Any:
         if isinstance(data, Mapping):
-            return {key: self._shrink_payload(value) for key, value in list(data.items())[:5]}
+            return {key: self._shrink_payload(value, dumps) for key, value in list(data.items())[:5]}
         if isinstance(data, (list, tuple)):
-            return [self._shrink_payload(item) for item in list(data)[:5]]
-        if hasattr(data, "model_dump"):
-            return self._shrink_payload(data.model_dump())
-        if hasattr(data, "dict"):
-            return self._shrink_payload(data.dict())  # type: ignore[call-arg]
+            return [self._shrink_payload(item, dumps) for item in list(data)[:5]]
+        if hasattr(data, "model_dump") or hasattr(data, "dict"):
+            key = id(data)
+            dumped = dumps.get(key)
+            if dumped is None:
+                dumped = model_dump(data)
+                dumps[key] = dumped
+            return self._shrink_payload(dumped, dumps)
         return data
 
     def _ensure_document_totals(self, document: Document) -> Document:
         return ensure_document_totals(document)  # type: ignore[return-value]
 
+    def _extract_document(self, document_in: DocumentIn) -> Document:
+        return self._ensure_document_totals(self.extractor.run(document_in))
+
     def _build_audit_summary(self, report: AuditReport) -> SemanticSummaryPayload:
-        highlights = [f"{issue.code}: {issue.message}" for issue in report.issues]
+        highlights: List[str] = []
+        issues: List[Dict[str, Any]] = []
+        for code, message, severity in map(_audit_issue_fields, report.issues):
+            highlights.append(f"{code}: {message}")
+            issues.append({"code": code, "message": message, "severity": severity})
         summary = "Documento aprovado na auditoria" if report.passed else "Documento com pendências"
         return SemanticSummaryPayload(
             document_id=report.document_id,
             stage="audit",
             summary=summary,
             highlights=highlights,
-            extra={"issues": [model_dump(issue) for issue in report.issues]},
+            extra={"issues": issues},
         )
 
     def _build_classification_summary(self, result: ClassificationResult) -> SemanticSummaryPayload:
@@ -436,17 +657,18 @@ class AsyncAgentController:
             stage="insight",
             summary=insight.summary,
             insights=list(insight.recommendations),
-            provenance=[model_dump(item) for item in insight.provenance],
+            provenance=[
+                {"description": description, "exists": exists}
+                for description, exists in map(_insight_reference_fields, insight.provenance)
+            ],
         )
 
-    async def _handle_accounting_totals(
-        self, document_in: DocumentIn, accounting: AccountingOutput
-    ) -> None:
+    def _handle_accounting_totals(self, document_id: str, accounting: AccountingOutput) -> None:
         totals = getattr(accounting, "totals", None)
         if self._totals_needs_attention(totals):
             if accounting.document is not None:
                 repaired = AccountantAgent.recompute_totals(
-                    accounting.document, document_id=document_in.document_id
+                    accounting.document, document_id=document_id
                 )
                 if hasattr(repaired, "totals"):
                     accounting.document = repaired  # type: ignore[assignment]
@@ -454,13 +676,13 @@ class AsyncAgentController:
                     log_totals_event(
                         agent="orchestrator",
                         stage="post_accountant_validation",
-                        document_id=document_in.document_id,
+                        document_id=document_id,
                         totals=accounting.totals,
                         status="recomputed",
                     )
 
         update_post_validation_benchmark(
-            document_id=document_in.document_id,
+            document_id=document_id,
             totals=accounting.totals,
             notes="post_accountant_validation",
         )
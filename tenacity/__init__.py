@@ -1,7 +1,7 @@
 """Lightweight tenacity stub used in offline test environments."""
 from __future__ import annotations
 
-from typing import Any, Callable, TypeVar
+from typing import Any, Callable, TypeVar, overload
 
 TFunc = TypeVar("TFunc", bound=Callable[..., Any])
 
@@ -13,11 +13,23 @@ class _RetryState:
         self.attempts = attempts
 
 
-def retry(*args: Any, **kwargs: Any) -> Callable[[TFunc], TFunc]:
-    def decorator(func: TFunc) -> TFunc:
-        return func
+def _passthrough(func: TFunc) -> TFunc:
+    return func
 
-    return decorator
+
+@overload
+def retry(func: TFunc, /) -> TFunc: ...
+
+
+@overload
+def retry(*args: Any, **kwargs: Any) -> Callable[[TFunc], TFunc]: ...
+
+
+def retry(*args: Any, **kwargs: Any) -> Any:
+    """Return the function unchanged; supports both ``@retry`` and ``@retry(...)``."""
+    if len(args) == 1 and not kwargs and callable(args[0]):
+        return args[0]
+    return _passthrough
 
 
 def stop_after_attempt(attempts: int) -> _RetryState:
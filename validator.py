@@ -1,12 +1,27 @@
 from __future__ import annotations
 
 import argparse
+import importlib.util
 import json
 import sys
 from pathlib import Path
+from typing import Any
 
 from backend.app.connectivity_validator import ConnectivityValidator
 
+_ORJSON_AVAILABLE = importlib.util.find_spec("orjson") is not None
+
+if _ORJSON_AVAILABLE:  # pragma: no cover - exercised in full environments
+    import orjson
+else:  # pragma: no cover - lightweight environments
+    orjson = None  # type: ignore[assignment]
+
+
+def _dumps(payload: Any) -> str:
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_INDENT_2).decode("utf-8")
+    return json.dumps(payload, ensure_ascii=False, indent=2)
+
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(
@@ -47,7 +62,12 @@ def parse_args() -> argparse.Namespace:
         default=None,
         help="Override manifest artifact directory for generated reports.",
     )
-    return parser.parse_args()
+    args = parser.parse_args()
+    # Resolve against the CWD once, up front, rather than on every later open.
+    args.manifest = args.manifest.resolve()
+    if args.output is not None:
+        args.output = args.output.resolve()
+    return args
 
 
 def main() -> int:
@@ -60,11 +80,13 @@ def main() -> int:
     )
     result = validator.run()
 
+    report_json = _dumps(result.to_dict()) if args.output or args.format == "json" else None
+
     if args.output:
-        args.output.write_text(json.dumps(result.to_dict(), indent=2), encoding="utf-8")
+        args.output.write_text(report_json, encoding="utf-8")
 
     if args.format == "json":
-        print(json.dumps(result.to_dict(), indent=2))
+        print(report_json)
     elif args.format == "markdown":
         print(result.to_markdown())
     else:
@@ -76,31 +98,34 @@ def main() -> int:
 
 def _print_console(result) -> None:
     summary = result.summary
-    scores = result.scores
-    print(f"[Nexus Connectivity Validator] {result.manifest_name}")
-    print(f" Environment : {result.environment}")
-    print(f" Mode        : {result.mode}")
-    print(f" Generated   : {result.timestamp}")
-    print(" Summary:")
-    print(f"   - Total checks : {summary['total']}")
-    print(f"   - Pass         : {summary['pass']}")
-    print(f"   - Warn         : {summary['warn']}")
-    print(f"   - Fail         : {summary['fail']}")
-    print(f"   - Critical     : {summary['critical_failures']}")
-    print(" Scores:")
-    for key, value in scores.items():
-        print(f"   - {key.title():<12}: {value:.2f}")
+    lines = [
+        f"[Nexus Connectivity Validator] {result.manifest_name}",
+        f" Environment : {result.environment}",
+        f" Mode        : {result.mode}",
+        f" Generated   : {result.timestamp}",
+        " Summary:",
+        f"   - Total checks : {summary['total']}",
+        f"   - Pass         : {summary['pass']}",
+        f"   - Warn         : {summary['warn']}",
+        f"   - Fail         : {summary['fail']}",
+        f"   - Critical     : {summary['critical_failures']}",
+        " Scores:",
+    ]
+    lines.extend(f"   - {key.title():<12}: {value:.2f}" for key, value in result.scores.items())
 
     if result.remediation.get("playbooks"):
-        print(" Suggested remediation:")
-        for item in result.remediation["playbooks"]:
-            print(f"   - {item['trigger']}: {', '.join(item['actions'])}")
+        lines.append(" Suggested remediation:")
+        lines.extend(
+            f"   - {item['trigger']}: {', '.join(item['actions'])}"
+            for item in result.remediation["playbooks"]
+        )
 
     if any(result.blocking_conditions.values()):
-        print(" Blocking conditions triggered:")
-        for key, value in result.blocking_conditions.items():
-            if value:
-                print(f"   - {key}")
+        lines.append(" Blocking conditions triggered:")
+        lines.extend(f"   - {key}" for key, value in result.blocking_conditions.items() if value)
+
+    # One write instead of a print() per line.
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 if __name__ == "__main__":